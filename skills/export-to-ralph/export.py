@@ -27,12 +27,15 @@ Examples:
 """
 
 import argparse
+import bisect
+import functools
 import os
 import re
 import shutil
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 
 # =============================================================================
@@ -48,9 +51,145 @@ NEW_FEATURES_DIR = Path("specs/new-features")
 FIX_PLAN_FILE = Path("@fix_plan.md")
 PROMPT_FILE = Path("PROMPT.md")
 
+# PROMPT.md "Current Focus" line (expected at line 16)
+CURRENT_FOCUS_PREFIX = "**Current Focus:**"
+CURRENT_FOCUS_SEARCH_LINES = 30
+
+# Banner line for console output
+SEPARATOR = "=" * 60
+
 # Regex patterns
-NEEDS_CLARIFICATION_PATTERN = re.compile(r'\[NEEDS CLARIFICATION[^\]]*\]', re.IGNORECASE)
-CURRENT_FOCUS_PATTERN = re.compile(r'^(\*\*Current Focus:\*\*)\s*.*$', re.MULTILINE)
+SPEC_ID_PATTERN = re.compile(r'^\d{3}$')
+NEEDS_CLARIFICATION_PATTERN = re.compile(r'\[NEEDS CLARIFICATION[^\]\n]*\]', re.IGNORECASE)
+CURRENT_FOCUS_PATTERN = re.compile(r'^\*\*Current Focus:\*\*[^\n]*$', re.MULTILINE)
+CODE_FENCE_LINE_PATTERN = re.compile(r'^[^\n]*?```', re.MULTILINE)
+
+# Lines whose markers are documentation/diagram context, not real markers:
+# inline code, table cells, numbered steps and Gherkin steps (by prefix),
+# Mermaid arrows, lines describing the marker itself, and checklist items
+# about markers
+EXCLUDED_LINE_PATTERN = re.compile('|'.join([
+    r'^\s*(?:`|\||\d+\.|(?:given|when|then|and|but):)',
+    r'-->',
+    *map(re.escape, [
+        'exit with error', 'blocks export', 'detects', 'finds',
+        'check for', 'regex', 'rule 1:', 'rule 2:', 'export shall',
+        'script checks', 'error detection', 'caught', 'markers block',
+        '[needs clarification] markers'
+    ]),
+    r'^(?=.*- \[[x ]\])(?=.*(?:no \[needs clarification\]|markers|addressed))',
+]), re.IGNORECASE)
+
+# PRD patterns
+TITLE_FRONTMATTER_PATTERN = re.compile(r'title:\s*["\']?([^"\'\n]+)["\']?')
+H1_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+VISION_PATTERN = re.compile(r'###\s*Vision\s*\n(.*?)(?=\n###|\n##|\Z)', re.DOTALL | re.IGNORECASE)
+
+# PLAN patterns
+# One left-to-right tokenizer for phases and tasks. A bare "###Phase" or
+# "- [ ] **" that is not a full header still ends the preceding body, and
+# task headers may not run across a phase boundary.
+PLAN_TOKEN_PATTERN = re.compile(
+    r'(?P<phase>###\s*Phase\s*(?P<phase_num>\d+)[:\s]*(?P<phase_name>[^\n]*)\n)'
+    r'|(?P<phase_end>###\s*Phase)'
+    r'|(?P<task>-\s*\[\s*[x ]?\s*\]\s*\*\*'
+    r'(?P<task_id_name>(?:(?!###\s*Phase)[^\*])+)\*\*'
+    r'(?P<task_meta>(?:(?!###\s*Phase)[^\n])*)\n)'
+    r'|(?P<task_end>-\s*\[\s*[x ]?\s*\]\s*\*\*)'
+)
+TASK_ID_PATTERN = re.compile(r'(T\d+\.\d+)\s+(.+)')
+COMPONENT_PATTERN = re.compile(r'\[component:\s*([^\]]+)\]', re.IGNORECASE)
+IMPLEMENT_PATTERN = re.compile(r'Implement:\s*([^\n]+)')
+TEST_PATTERN = re.compile(r'Test:\s*([^\n]+)')
+SUCCESS_PATTERN = re.compile(r'Success:\s*([^\n]+)')
+FILE_PATH_PATTERN = re.compile(r'`([^`]+)`|Create\s+(\S+)')
+PRD_REF_PATTERN = re.compile(r'\[ref:\s*(PRD/AC-[\d\.]+)\]')
+
+# Template placeholders, e.g. {project_name}
+PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+# (mtime_ns, size, decoded content), keyed by path (see _read_text)
+_FILE_CACHE: Dict[Path, Tuple[int, int, str]] = {}
+
+# Found spec directory, keyed by (spec ID, specs dir, mtime_ns) (see _find_spec_dir)
+_SPEC_DIR_CACHE: Dict[Tuple[str, str, int], Path] = {}
+
+
+# =============================================================================
+# File Reading
+# =============================================================================
+
+def _file_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    """
+    Identify a file's current contents as (path, mtime_ns, size).
+
+    Returns None if the file cannot be stat'ed (e.g. it does not exist).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _read_text(path: Path) -> str:
+    """
+    Read a UTF-8 text file, caching the decoded content.
+
+    The spec documents are read by validate_spec() and again by the document
+    readers; the cache lets the second read skip the open/read/decode. Cache
+    entries are invalidated when the file's mtime or size changes.
+    """
+    stat = os.stat(path)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    # Unbuffered binary read skips the BufferedReader/TextIOWrapper layers
+    with open(path, 'rb', buffering=0) as f:
+        content = f.read().decode('utf-8')
+    # Keep read_text()'s universal newline behavior
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    _FILE_CACHE[path] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+
+def _read_text_if_exists(path: Path) -> Optional[str]:
+    """Read a text file through the cache, or return None if it is missing."""
+    try:
+        return _read_text(path)
+    except FileNotFoundError:
+        return None
+
+
+def _existing_names(directory: Path, names: Iterable[str]) -> Set[str]:
+    """
+    Return which of names exist in directory.
+
+    Uses one directory listing instead of a stat per name, falling back to a
+    stat for names not listed (case-insensitive filesystems).
+    """
+    try:
+        with os.scandir(directory) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+
+    return {
+        name for name in names
+        if name in present or (directory / name).exists()
+    }
+
+
+def _load_template(path: Path, default: str) -> str:
+    """
+    Load a template through the _read_text cache.
+
+    Returns default if the template file does not exist.
+    """
+    template = _read_text_if_exists(path)
+    return default if template is None else template
 
 
 # =============================================================================
@@ -118,11 +257,10 @@ def resolve_spec_path(spec: str) -> Optional[Path]:
         return Path(spec)
 
     # If it's a spec ID (3 digits), find matching directory
-    if re.match(r'^\d{3}$', spec):
-        if SPECS_DIR.exists():
-            for dir_path in SPECS_DIR.iterdir():
-                if dir_path.is_dir() and dir_path.name.startswith(f"{spec}-"):
-                    return dir_path
+    if SPEC_ID_PATTERN.match(spec):
+        spec_path = _find_spec_dir(spec, SPECS_DIR)
+        if spec_path is not None:
+            return spec_path
 
     # Try as direct path
     spec_path = Path(spec)
@@ -132,81 +270,112 @@ def resolve_spec_path(spec: str) -> Optional[Path]:
     return None
 
 
-def find_clarification_markers(content: str) -> List[str]:
+def _find_spec_dir(spec: str, specs_dir: Path) -> Optional[Path]:
+    """
+    Find the specs_dir entry for a spec ID.
+
+    Found directories are cached by spec ID, absolute specs_dir and its
+    mtime, which changes when a spec directory is added, removed or renamed.
+    Misses are not cached.
+    """
+    try:
+        key = (spec, os.path.abspath(specs_dir), os.stat(specs_dir).st_mtime_ns)
+    except OSError:
+        return None
+
+    cached = _SPEC_DIR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    prefix = f"{spec}-"
+    try:
+        # DirEntry.is_dir() uses the type from the directory listing
+        # where available, so only the name match costs anything
+        with os.scandir(specs_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_dir():
+                    spec_path = Path(entry.path)
+                    _SPEC_DIR_CACHE[key] = spec_path
+                    return spec_path
+    except OSError:
+        pass
+    return None
+
+
+def iter_clarification_markers(content: str) -> Iterator[str]:
     """
-    Find all [NEEDS CLARIFICATION] markers in content.
+    Yield each [NEEDS CLARIFICATION] marker in content.
 
     Excludes markers that are:
     - In code blocks (backticks)
     - In validation checklist items
     - In documentation describing the marker itself
     - In Gherkin scenarios, Mermaid diagrams, or table cells
+
+    Scans for markers first and only classifies the lines that contain one,
+    so the cost scales with the number of markers rather than lines.
     """
-    markers = []
+    # Start offsets of lines containing ```; each one toggles code block state.
+    # Only computed once a marker is found, so clean documents take one scan.
+    fence_starts = None
 
-    # Split into lines for context-aware checking
-    lines = content.split('\n')
-    in_code_block = False
+    line_start = -1
+    skip_line = False
+    line = ""
 
-    for i, line in enumerate(lines):
-        # Track code block state
-        if '```' in line:
-            in_code_block = not in_code_block
-            continue
+    for match in NEEDS_CLARIFICATION_PATTERN.finditer(content):
+        start = content.rfind('\n', 0, match.start()) + 1
 
-        # Skip if inside a code block
-        if in_code_block:
-            continue
+        # Classify each line once, even if it holds several markers
+        if start != line_start:
+            line_start = start
+            line_end = content.find('\n', match.end())
+            line = content[start:] if line_end == -1 else content[start:line_end]
 
-        # Skip inline code (backticks)
-        if line.strip().startswith('`'):
-            continue
+            if fence_starts is None:
+                fence_starts = [m.start() for m in CODE_FENCE_LINE_PATTERN.finditer(content)]
 
-        # Skip validation checklist lines
-        if '- [x]' in line.lower() or '- [ ]' in line.lower():
-            if any(kw in line.lower() for kw in ['no [needs clarification]', 'markers', 'addressed']):
-                continue
-
-        # Skip documentation lines describing the marker
-        doc_keywords = [
-            'exit with error', 'blocks export', 'detects', 'finds',
-            'check for', 'regex', 'rule 1:', 'rule 2:', 'export shall',
-            'script checks', 'error detection', 'caught', 'markers block'
-        ]
-        if any(kw in line.lower() for kw in doc_keywords):
-            continue
+            # Inside a code block if an odd number of fence lines precede it
+            in_code_block = bisect.bisect_left(fence_starts, start) % 2 == 1
 
-        # Skip lines where marker is immediately followed by "markers" (meta-documentation)
-        if '[needs clarification] markers' in line.lower():
-            continue
+            skip_line = (
+                '```' in line
+                or in_code_block
+                or EXCLUDED_LINE_PATTERN.search(line) is not None
+            )
 
-        # Skip Gherkin scenario lines
-        gherkin_prefixes = ['given:', 'when:', 'then:', 'and:', 'but:']
-        stripped = line.strip().lower()
-        if any(stripped.startswith(prefix) for prefix in gherkin_prefixes):
+        if skip_line:
             continue
 
-        # Skip Mermaid diagram lines
-        if '-->' in line or '-->>' in line:
+        # Skip if marker is in backticks (inline code)
+        marker = match.group(0)
+        if f'`{marker}`' in line or '`[NEEDS CLARIFICATION' in line:
             continue
+        yield marker
 
-        # Skip table cells (lines starting with |)
-        if stripped.startswith('|'):
-            continue
 
-        # Skip numbered steps (e.g., "5. Script checks...")
-        if re.match(r'^\s*\d+\.', line):
-            continue
+def find_clarification_markers(content: str) -> List[str]:
+    """Find all [NEEDS CLARIFICATION] markers in content."""
+    return list(iter_clarification_markers(content))
+
+
+def count_clarification_markers(content: str, limit: Optional[int] = None) -> int:
+    """
+    Count [NEEDS CLARIFICATION] markers in content.
 
-        # Find actual markers on this line
-        found = NEEDS_CLARIFICATION_PATTERN.findall(line)
-        for marker in found:
-            # Skip if marker is in backticks (inline code)
-            if f'`{marker}`' in line or '`[NEEDS CLARIFICATION' in line:
-                continue
-            markers.append(marker)
+    Args:
+        content: Document text
+        limit: Stop counting once this many markers are found
 
-    return markers
+    Returns:
+        Number of markers (at most limit, when given)
+    """
+    count = 0
+    for _ in iter_clarification_markers(content):
+        count += 1
+        if limit is not None and count >= limit:
+            break
+    return count
 
 
 def validate_spec(spec_dir: Path) -> Tuple[bool, List[str], List[str]]:
@@ -226,42 +395,44 @@ def validate_spec(spec_dir: Path) -> Tuple[bool, List[str], List[str]]:
     sdd_path = spec_dir / "solution-design.md"
     plan_path = spec_dir / "implementation-plan.md"
 
-    # Check PRD exists (required)
+    # Check required documents exist before reading any content; export
+    # cannot proceed without them, so the reads and marker scans would be
+    # wasted
     if not prd_path.exists():
         errors.append(f"PRD not found: {prd_path}")
-    else:
-        prd_content = prd_path.read_text(encoding='utf-8')
+    if not plan_path.exists():
+        errors.append("PLAN not found - required for @fix_plan.md generation")
+    sdd_exists = sdd_path.exists()
+    if not sdd_exists:
+        warnings.append("SDD not found - specs/new-features/ will be incomplete")
+    if errors:
+        return False, errors, warnings
 
-        # Check for clarification markers
-        markers = find_clarification_markers(prd_content)
-        if markers:
-            errors.append(f"PRD has {len(markers)} [NEEDS CLARIFICATION] markers")
+    # Check PRD for clarification markers
+    prd_content = _read_text(prd_path)
+    marker_count = count_clarification_markers(prd_content)
+    if marker_count:
+        errors.append(f"PRD has {marker_count} [NEEDS CLARIFICATION] markers")
 
-        # Check for Must-Have features
-        if "### Must Have Features" not in prd_content and "### Must Have" not in prd_content:
-            errors.append("PRD has no Must-Have features section")
+    # Check for Must-Have features
+    if "### Must Have Features" not in prd_content and "### Must Have" not in prd_content:
+        errors.append("PRD has no Must-Have features section")
 
     # Check SDD (optional but recommended)
-    if not sdd_path.exists():
-        warnings.append("SDD not found - specs/new-features/ will be incomplete")
-    else:
-        sdd_content = sdd_path.read_text(encoding='utf-8')
-        markers = find_clarification_markers(sdd_content)
-        if markers:
-            errors.append(f"SDD has {len(markers)} [NEEDS CLARIFICATION] markers")
+    if sdd_exists:
+        marker_count = count_clarification_markers(_read_text(sdd_path))
+        if marker_count:
+            errors.append(f"SDD has {marker_count} [NEEDS CLARIFICATION] markers")
 
     # Check PLAN (required for task list)
-    if not plan_path.exists():
-        errors.append("PLAN not found - required for @fix_plan.md generation")
-    else:
-        plan_content = plan_path.read_text(encoding='utf-8')
-        markers = find_clarification_markers(plan_content)
-        if markers:
-            errors.append(f"PLAN has {len(markers)} [NEEDS CLARIFICATION] markers")
+    plan_content = _read_text(plan_path)
+    marker_count = count_clarification_markers(plan_content)
+    if marker_count:
+        errors.append(f"PLAN has {marker_count} [NEEDS CLARIFICATION] markers")
 
-        # Check for Phase 1
-        if "### Phase 1" not in plan_content:
-            errors.append("PLAN has no Phase 1 section")
+    # Check for Phase 1
+    if "### Phase 1" not in plan_content:
+        errors.append("PLAN has no Phase 1 section")
 
     can_proceed = len(errors) == 0
     return can_proceed, errors, warnings
@@ -277,18 +448,15 @@ def validate_project_structure(output_dir: Path) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (can_proceed, missing_items)
     """
-    missing = []
-
     # Required files/directories for project-specific mode
     required = [
-        (output_dir / "PROMPT.md", "PROMPT.md"),
-        (output_dir / "@AGENT.md", "@AGENT.md"),
-        (output_dir / "specs", "specs/"),
+        ("PROMPT.md", "PROMPT.md"),
+        ("@AGENT.md", "@AGENT.md"),
+        ("specs", "specs/"),
     ]
 
-    for path, name in required:
-        if not path.exists():
-            missing.append(name)
+    present = _existing_names(output_dir, (entry_name for entry_name, _ in required))
+    missing = [name for entry_name, name in required if entry_name not in present]
 
     return len(missing) == 0, missing
 
@@ -297,28 +465,52 @@ def validate_project_structure(output_dir: Path) -> Tuple[bool, List[str]]:
 # Document Readers
 # =============================================================================
 
+class PlanTask(NamedTuple):
+    """A task parsed from an implementation plan phase."""
+    id: str
+    name: str
+    parallel: bool
+    component: Optional[str]
+    file_path: str
+    test_desc: str
+    success: str
+    prd_ref: str
+
+
+class Phase(NamedTuple):
+    """An implementation plan phase and its tasks."""
+    name: str
+    tasks: List[PlanTask]
+
+
 def read_prd(prd_path: Path) -> Dict:
     """
     Read and parse PRD document.
 
-    Returns dict with extracted sections.
+    Returns dict with extracted sections. Results are cached until the file
+    changes, so treat the dict as read-only.
     """
-    if not prd_path.exists():
+    key = _file_key(prd_path)
+    if key is None:
         return {}
+    return _parse_prd(*key)
 
-    content = prd_path.read_text(encoding='utf-8')
 
-    def extract_subsection(header: str) -> str:
-        """Extract content under a subsection header."""
-        pattern = rf'###\s*{re.escape(header)}\s*\n(.*?)(?=\n###|\n##|\Z)'
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+@functools.lru_cache(maxsize=32)
+def _parse_prd(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a PRD; mtime_ns and size are part of the cache key only."""
+    content = _read_text(Path(path))
+
+    def extract_vision() -> str:
+        """Extract content under the Vision subsection header."""
+        match = VISION_PATTERN.search(content)
         if match:
             return match.group(1).strip()
         return ""
 
     return {
         'title': extract_prd_title(content),
-        'vision': extract_subsection("Vision"),
+        'vision': extract_vision(),
         'raw_content': content
     }
 
@@ -326,12 +518,12 @@ def read_prd(prd_path: Path) -> Dict:
 def extract_prd_title(content: str) -> str:
     """Extract title from PRD frontmatter or first heading."""
     # Try frontmatter
-    match = re.search(r'title:\s*["\']?([^"\'\n]+)["\']?', content)
+    match = TITLE_FRONTMATTER_PATTERN.search(content)
     if match:
         return match.group(1).strip()
 
     # Try first H1
-    match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    match = H1_PATTERN.search(content)
     if match:
         return match.group(1).strip()
 
@@ -342,79 +534,89 @@ def read_plan(plan_path: Path) -> Dict:
     """
     Read and parse PLAN document.
 
-    Returns dict with extracted phases and tasks.
+    Returns dict with extracted phases and tasks. Results are cached until
+    the file changes, so treat the dict as read-only.
     """
-    if not plan_path.exists():
+    key = _file_key(plan_path)
+    if key is None:
         return {}
-
-    content = plan_path.read_text(encoding='utf-8')
-
-    def extract_phases() -> Dict[str, List[Dict]]:
-        """Extract all phases and their tasks."""
+    return _parse_plan(*key)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_plan(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a PLAN; mtime_ns and size are part of the cache key only."""
+    content = _read_text(Path(path))
+
+    def parse_task(header: re.Match, task_body: str) -> PlanTask:
+        """Build a PlanTask from a task header token and its body."""
+        task_id_name = header.group('task_id_name').strip()
+        task_meta = header.group('task_meta').strip()
+        task_body = task_body.strip()
+
+        # Parse task ID and name
+        id_match = TASK_ID_PATTERN.match(task_id_name)
+        task_id, task_name = id_match.groups() if id_match else (task_id_name, task_id_name)
+
+        # Extract metadata
+        parallel = '[parallel: true]' in task_meta.lower()
+        component_match = COMPONENT_PATTERN.search(task_meta)
+        component = component_match.group(1) if component_match else None
+
+        # Extract key lines
+        implement_match = IMPLEMENT_PATTERN.search(task_body)
+        test_match = TEST_PATTERN.search(task_body)
+        success_match = SUCCESS_PATTERN.search(task_body)
+
+        # Extract file path from Implement line
+        file_path = ""
+        if implement_match:
+            impl_text = implement_match.group(1)
+            path_match = FILE_PATH_PATTERN.search(impl_text)
+            if path_match:
+                file_path = path_match.group(1) or path_match.group(2) or ""
+
+        # Extract PRD reference
+        ref_match = PRD_REF_PATTERN.search(task_body)
+        prd_ref = ref_match.group(1) if ref_match else ""
+
+        return PlanTask(
+            id=task_id,
+            name=task_name,
+            parallel=parallel,
+            component=component,
+            file_path=file_path,
+            test_desc=test_match.group(1).strip() if test_match else "",
+            success=success_match.group(1).strip() if success_match else "",
+            prd_ref=prd_ref
+        )
+
+    def extract_phases() -> Dict[str, Phase]:
+        """Extract all phases and their tasks in a single pass."""
         phases = {}
-
-        # Find phase sections
-        phase_pattern = r'###\s*Phase\s*(\d+)[:\s]*([^\n]*)\n(.*?)(?=###\s*Phase|\Z)'
-        for match in re.finditer(phase_pattern, content, re.DOTALL):
-            phase_num = match.group(1)
-            phase_name = match.group(2).strip()
-            phase_content = match.group(3)
-
-            tasks = []
-
-            # Find task blocks
-            task_pattern = r'-\s*\[\s*[x ]?\s*\]\s*\*\*([^\*]+)\*\*([^\n]*)\n(.*?)(?=-\s*\[\s*[x ]?\s*\]\s*\*\*|\Z)'
-            for task_match in re.finditer(task_pattern, phase_content, re.DOTALL):
-                task_id_name = task_match.group(1).strip()
-                task_meta = task_match.group(2).strip()
-                task_body = task_match.group(3).strip()
-
-                # Parse task ID and name
-                id_match = re.match(r'(T\d+\.\d+)\s+(.+)', task_id_name)
-                if id_match:
-                    task_id = id_match.group(1)
-                    task_name = id_match.group(2)
-                else:
-                    task_id = task_id_name
-                    task_name = task_id_name
-
-                # Extract metadata
-                parallel = '[parallel: true]' in task_meta.lower()
-                component_match = re.search(r'\[component:\s*([^\]]+)\]', task_meta, re.IGNORECASE)
-                component = component_match.group(1) if component_match else None
-
-                # Extract key lines
-                implement_match = re.search(r'Implement:\s*(.+?)(?=\n|$)', task_body)
-                test_match = re.search(r'Test:\s*(.+?)(?=\n|$)', task_body)
-                success_match = re.search(r'Success:\s*(.+?)(?=\n|$)', task_body)
-
-                # Extract file path from Implement line
-                file_path = ""
-                if implement_match:
-                    impl_text = implement_match.group(1)
-                    path_match = re.search(r'`([^`]+)`|Create\s+(\S+)', impl_text)
-                    if path_match:
-                        file_path = path_match.group(1) or path_match.group(2) or ""
-
-                # Extract PRD reference
-                ref_match = re.search(r'\[ref:\s*(PRD/AC-[\d\.]+)\]', task_body)
-                prd_ref = ref_match.group(1) if ref_match else ""
-
-                tasks.append({
-                    'id': task_id,
-                    'name': task_name,
-                    'parallel': parallel,
-                    'component': component,
-                    'file_path': file_path,
-                    'test_desc': test_match.group(1).strip() if test_match else "",
-                    'success': success_match.group(1).strip() if success_match else "",
-                    'prd_ref': prd_ref
-                })
-
-            phases[phase_num] = {
-                'name': phase_name,
-                'tasks': tasks
-            }
+        tasks = None      # Task list of the current phase, None outside one
+        pending = None    # Task header whose body is still being read
+
+        for token in PLAN_TOKEN_PATTERN.finditer(content):
+            # Any token ends the body of the pending task
+            if pending is not None:
+                tasks.append(parse_task(pending, content[pending.end():token.start()]))
+                pending = None
+
+            kind = token.lastgroup
+            if kind == 'phase':
+                tasks = []
+                phases[token.group('phase_num')] = Phase(
+                    name=token.group('phase_name').strip(),
+                    tasks=tasks
+                )
+            elif kind == 'phase_end':
+                tasks = None
+            elif kind == 'task' and tasks is not None:
+                pending = token
+
+        if pending is not None:
+            tasks.append(parse_task(pending, content[pending.end():]))
 
         return phases
 
@@ -428,44 +630,65 @@ def read_plan(plan_path: Path) -> Dict:
 # Transformers
 # =============================================================================
 
-def flatten_plan_task(task: Dict) -> str:
+def flatten_plan_task(task: PlanTask) -> str:
     """
     Flatten a PLAN task into a @fix_plan.md checkbox item.
 
-    Input task dict with: id, name, file_path, test_desc, prd_ref
+    Input PlanTask; uses id, name, file_path, test_desc, prd_ref
     Output: "- [ ] T1.1: Description (file_path) [ref: PRD/AC-X.Y]"
     """
-    task_id = task.get('id', 'T?.?')
-    task_name = task.get('name', 'Unknown')
-    file_path = task.get('file_path', '')
-    test_desc = task.get('test_desc', '')
-    prd_ref = task.get('prd_ref', '')
-
-    # Build description
-    desc_parts = [task_name]
-    if test_desc:
-        desc_parts.append(f"with {test_desc}")
-
-    description = ' '.join(desc_parts)
+    # Add test description if present
+    test_note = f" with {task.test_desc}" if task.test_desc else ""
 
     # Add file path if present
-    file_note = f" ({file_path})" if file_path else ""
+    file_note = f" ({task.file_path})" if task.file_path else ""
 
     # Add PRD reference if present
-    ref_note = f" [ref: {prd_ref}]" if prd_ref else ""
+    ref_note = f" [ref: {task.prd_ref}]" if task.prd_ref else ""
 
-    return f"- [ ] {task_id}: {description}{file_note}{ref_note}"
+    return f"- [ ] {task.id}: {task.name}{test_note}{file_note}{ref_note}"
+
+
+def render_template(template: str, values: Dict[str, str]) -> str:
+    """
+    Replace {placeholder} tokens in a template in a single pass.
+
+    Unknown placeholders and other braces are left untouched.
+    """
+    return PLACEHOLDER_PATTERN.sub(
+        lambda match: values.get(match.group(1), match.group(0)),
+        template
+    )
+
+
+def _collect_tasks(
+    tasks: List[PlanTask],
+    target: List[str],
+    parallel_notes: Optional[List[str]],
+    prd_refs: Dict[str, List[str]]
+) -> None:
+    """
+    Flatten a phase's tasks into target, recording parallel and PRD notes.
+
+    Parallel notes are only recorded when parallel_notes is given.
+    """
+    for task in tasks:
+        task_id, prd_ref = task.id, task.prd_ref
+        target.append(flatten_plan_task(task))
+        if parallel_notes is not None and task.parallel:
+            parallel_notes.append(f"- {task_id} can run in parallel with other parallel tasks")
+        if prd_ref:
+            prd_refs[prd_ref].append(task_id)
 
 
 def transform_fixplan(plan: Dict, project_name: str) -> str:
     """
     Transform PLAN into @fix_plan.md content.
     """
-    template_path = TEMPLATES_DIR / "fixplan-template.md"
-    if template_path.exists():
-        template = template_path.read_text(encoding='utf-8')
-    else:
-        template = "# {project_name} Fix Plan\n\n## High Priority\n\n{high_priority_tasks}"
+    template = _load_template(
+        TEMPLATES_DIR / "fixplan-template.md",
+        "# {project_name} Fix Plan\n\n## High Priority\n\n{high_priority_tasks}"
+    )
 
     high_tasks = []
     medium_tasks = []
@@ -478,48 +701,21 @@ def transform_fixplan(plan: Dict, project_name: str) -> str:
         phases = plan['phases']
 
         # Track tasks with PRD refs for traceability
-        prd_refs = {}
-
-        # Phase 1 -> High
-        if '1' in phases:
-            phase_name = phases['1'].get('name', 'Phase 1')
-            dependency_notes.append(f"- **Phase 1 ({phase_name})**: Must complete before Phase 2")
-            for task in phases['1'].get('tasks', []):
-                high_tasks.append(flatten_plan_task(task))
-                if task.get('parallel'):
-                    parallel_notes.append(f"- {task.get('id')} can run in parallel with other parallel tasks")
-                if task.get('prd_ref'):
-                    ref = task.get('prd_ref')
-                    if ref not in prd_refs:
-                        prd_refs[ref] = []
-                    prd_refs[ref].append(task.get('id'))
-
-        # Phase 2 -> Medium
-        if '2' in phases:
-            phase_name = phases['2'].get('name', 'Phase 2')
-            dependency_notes.append(f"- **Phase 2 ({phase_name})**: Depends on Phase 1 completion")
-            for task in phases['2'].get('tasks', []):
-                medium_tasks.append(flatten_plan_task(task))
-                if task.get('parallel'):
-                    parallel_notes.append(f"- {task.get('id')} can run in parallel with other parallel tasks")
-                if task.get('prd_ref'):
-                    ref = task.get('prd_ref')
-                    if ref not in prd_refs:
-                        prd_refs[ref] = []
-                    prd_refs[ref].append(task.get('id'))
-
-        # Phase 3+ -> Low
-        for phase_num in sorted(phases.keys()):
-            if int(phase_num) >= 3:
-                phase_name = phases[phase_num].get('name', f'Phase {phase_num}')
+        prd_refs: Dict[str, List[str]] = defaultdict(list)
+
+        # Phase 1 -> High, Phase 2 -> Medium, Phase 3+ -> Low
+        for phase_num in sorted(phases, key=int):
+            phase = phases[phase_num]
+            phase_name = phase.name
+            if phase_num == '1':
+                dependency_notes.append(f"- **Phase 1 ({phase_name})**: Must complete before Phase 2")
+                _collect_tasks(phase.tasks, high_tasks, parallel_notes, prd_refs)
+            elif phase_num == '2':
+                dependency_notes.append(f"- **Phase 2 ({phase_name})**: Depends on Phase 1 completion")
+                _collect_tasks(phase.tasks, medium_tasks, parallel_notes, prd_refs)
+            elif int(phase_num) >= 3:
                 dependency_notes.append(f"- **Phase {phase_num} ({phase_name})**: Lower priority, implement after core features")
-                for task in phases[phase_num].get('tasks', []):
-                    low_tasks.append(flatten_plan_task(task))
-                    if task.get('prd_ref'):
-                        ref = task.get('prd_ref')
-                        if ref not in prd_refs:
-                            prd_refs[ref] = []
-                        prd_refs[ref].append(task.get('id'))
+                _collect_tasks(phase.tasks, low_tasks, None, prd_refs)
 
         # Build traceability notes
         for ref, task_ids in prd_refs.items():
@@ -535,21 +731,25 @@ def transform_fixplan(plan: Dict, project_name: str) -> str:
     traceability_str = '\n'.join(traceability_notes) if traceability_notes else "- All tasks trace to PRD requirements"
 
     # Replace template placeholders
-    result = template.replace('{project_name}', project_name)
-    result = result.replace('{high_priority_tasks}', high_str)
-    result = result.replace('{medium_priority_tasks}', medium_str)
-    result = result.replace('{low_priority_tasks}', low_str)
-    result = result.replace('{completed_tasks}', "- [x] Project initialization")
-    result = result.replace('{parallel_notes}', parallel_str)
-    result = result.replace('{dependency_notes}', dependency_str)
-    result = result.replace('{traceability_notes}', traceability_str)
-    # Legacy support for old template format
-    result = result.replace('{notes}', dependency_str)
-
-    return result
-
-
-def update_prompt_current_focus(prompt_path: Path, feature_name: str, description: str) -> str:
+    return render_template(template, {
+        'project_name': project_name,
+        'high_priority_tasks': high_str,
+        'medium_priority_tasks': medium_str,
+        'low_priority_tasks': low_str,
+        'completed_tasks': "- [x] Project initialization",
+        'parallel_notes': parallel_str,
+        'dependency_notes': dependency_str,
+        'traceability_notes': traceability_str,
+        # Legacy support for old template format
+        'notes': dependency_str,
+    })
+
+
+def update_prompt_current_focus(
+    prompt_path: Path,
+    feature_name: str,
+    description: str
+) -> Tuple[Optional[str], str]:
     """
     Update the "Current Focus" line in PROMPT.md.
 
@@ -559,12 +759,13 @@ def update_prompt_current_focus(prompt_path: Path, feature_name: str, descriptio
         description: Brief description from PRD vision
 
     Returns:
-        Updated content
+        Tuple of (original_content, updated_content). original_content is
+        None if PROMPT.md does not exist; updated_content equals it if there
+        is no Current Focus line.
     """
-    if not prompt_path.exists():
-        return ""
-
-    content = prompt_path.read_text(encoding='utf-8')
+    content = _read_text_if_exists(prompt_path)
+    if content is None:
+        return None, ""
 
     # Build new current focus line
     # Truncate description if too long
@@ -573,10 +774,21 @@ def update_prompt_current_focus(prompt_path: Path, feature_name: str, descriptio
 
     new_focus = f"**Current Focus:** {feature_name} - {description}"
 
-    # Replace the Current Focus line
-    updated = CURRENT_FOCUS_PATTERN.sub(new_focus, content)
+    # Replace the Current Focus line in place; it normally sits near line 16
+    start = 0
+    for _ in range(CURRENT_FOCUS_SEARCH_LINES):
+        end = content.find('\n', start)
+        if end == -1:
+            end = len(content)
+        if content.startswith(CURRENT_FOCUS_PREFIX, start, end):
+            return content, content[:start] + new_focus + content[end:]
+        if end == len(content):
+            break
+        start = end + 1
 
-    return updated
+    # Fall back to scanning the whole file; like the in-place edit, replace
+    # only the first Current Focus line and never the line after it
+    return content, CURRENT_FOCUS_PATTERN.sub(lambda _: new_focus, content, count=1)
 
 
 # =============================================================================
@@ -596,28 +808,28 @@ def copy_spec_files(
     copied = []
     target_dir = output_dir / NEW_FEATURES_DIR
 
-    files_to_copy = [
+    spec_files = (
         "product-requirements.md",
         "solution-design.md",
         "implementation-plan.md"
-    ]
+    )
+    present = _existing_names(spec_dir, spec_files)
+    files_to_copy = [filename for filename in spec_files if filename in present]
+
+    # Create target directory once, only if there is something to copy
+    if files_to_copy and not dry_run:
+        target_dir.mkdir(parents=True, exist_ok=True)
 
     for filename in files_to_copy:
         src = spec_dir / filename
         dst = target_dir / filename
 
-        if not src.exists():
-            continue
-
         if dry_run:
             print(f"  [DRY RUN] Would copy: {src} -> {dst}")
             copied.append(filename)
             continue
 
-        # Create target directory
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy file
+        # Copy file (copy2 uses sendfile/fcopyfile where the OS supports it)
         shutil.copy2(src, dst)
         copied.append(filename)
         print(f"  Copied: {filename}")
@@ -627,13 +839,14 @@ def copy_spec_files(
 
 def write_fixplan(
     output_dir: Path,
-    content: str,
+    content: bytes,
     dry_run: bool = False,
     force: bool = False
 ) -> bool:
     """
     Write @fix_plan.md to project root.
 
+    content is the UTF-8 encoded file, written as-is (no newline translation).
     Returns True if written successfully.
     """
     target = output_dir / FIX_PLAN_FILE
@@ -645,11 +858,11 @@ def write_fixplan(
     # Check for existing file
     if target.exists() and not force:
         response = input(f"  File exists: {target}. Overwrite? (y/N): ")
-        if response.lower() != 'y':
+        if response not in ('y', 'Y'):
             print(f"  Skipped: {target}")
             return False
 
-    target.write_text(content, encoding='utf-8')
+    target.write_bytes(content)
     print(f"  Created: {target}")
     return True
 
@@ -667,17 +880,24 @@ def update_prompt(
     """
     prompt_path = output_dir / PROMPT_FILE
 
-    if not prompt_path.exists():
+    original_content, updated_content = update_prompt_current_focus(
+        prompt_path, feature_name, description
+    )
+
+    if original_content is None:
         print(f"  Warning: {prompt_path} not found, skipping update")
         return False
 
-    updated_content = update_prompt_current_focus(prompt_path, feature_name, description)
+    # Skip the rewrite when there is nothing to change
+    if updated_content == original_content:
+        print(f"  Unchanged: {prompt_path} (no Current Focus line or already current)")
+        return False
 
     if dry_run:
         print(f"  [DRY RUN] Would update Current Focus in: {prompt_path}")
         return True
 
-    prompt_path.write_text(updated_content, encoding='utf-8')
+    prompt_path.write_bytes(updated_content.encode('utf-8'))
     print(f"  Updated: {prompt_path} (Current Focus line)")
     return True
 
@@ -708,12 +928,17 @@ def main():
     """Main entry point."""
     args = parse_args()
 
-    print(f"\n{'='*60}")
+    # Block-buffer stdout instead of a write per line on a TTY; each step
+    # heading flushes once, and input() flushes before prompting
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    print(f"\n{SEPARATOR}")
     print("Export to Ralph")
-    print(f"{'='*60}\n")
+    print(f"{SEPARATOR}\n")
 
     # Step 1: Resolve spec path
-    print(f"Resolving spec: {args.spec}")
+    print(f"Resolving spec: {args.spec}", flush=True)
     spec_dir = resolve_spec_path(args.spec)
 
     if not spec_dir:
@@ -724,7 +949,7 @@ def main():
     print(f"  Found: {spec_dir}")
 
     # Step 2: Validate project structure
-    print("\nValidating project structure...")
+    print("\nValidating project structure...", flush=True)
     structure_ok, missing = validate_project_structure(args.output_dir)
 
     if not structure_ok:
@@ -738,7 +963,7 @@ def main():
     print("  Project structure validated!")
 
     # Step 3: Validate specification
-    print("\nValidating specification...")
+    print("\nValidating specification...", flush=True)
     can_proceed, errors, warnings = validate_spec(spec_dir)
 
     if warnings:
@@ -756,7 +981,7 @@ def main():
     print("  Validation passed!")
 
     # Step 4: Read documents
-    print("\nReading documents...")
+    print("\nReading documents...", flush=True)
     prd = read_prd(spec_dir / "product-requirements.md")
     plan = read_plan(spec_dir / "implementation-plan.md")
 
@@ -769,7 +994,7 @@ def main():
     print(f"\nProject: {project_name}")
 
     # Step 5: Copy spec files to specs/new-features/
-    print(f"\nCopying spec files to {NEW_FEATURES_DIR}/...")
+    print(f"\nCopying spec files to {NEW_FEATURES_DIR}/...", flush=True)
     if args.dry_run:
         print("  (DRY RUN - no files will be created)")
 
@@ -777,27 +1002,27 @@ def main():
     print(f"  Copied {len(copied)} files")
 
     # Step 6: Generate and write @fix_plan.md
-    print("\nGenerating @fix_plan.md...")
-    fixplan_content = transform_fixplan(plan, project_name)
+    print("\nGenerating @fix_plan.md...", flush=True)
+    fixplan_content = transform_fixplan(plan, project_name).encode('utf-8')
     print(f"  Generated: {len(fixplan_content)} bytes")
 
     write_fixplan(args.output_dir, fixplan_content, dry_run=args.dry_run, force=args.force)
 
     # Step 7: Update PROMPT.md Current Focus
-    print("\nUpdating PROMPT.md Current Focus...")
+    print("\nUpdating PROMPT.md Current Focus...", flush=True)
     update_prompt(args.output_dir, project_name, project_desc, dry_run=args.dry_run)
 
     # Step 8: Cleanup source (unless --no-cleanup)
     if not args.no_cleanup:
-        print("\nCleaning up source...")
+        print("\nCleaning up source...", flush=True)
         cleanup_source(spec_dir, dry_run=args.dry_run)
     else:
         print("\nSkipping cleanup (--no-cleanup specified)")
 
     # Step 9: Summary
-    print(f"\n{'='*60}")
+    print(f"\n{SEPARATOR}")
     print("Export Complete!")
-    print(f"{'='*60}")
+    print(SEPARATOR)
 
     print(f"\nFiles in specs/new-features/:")
     for f in copied:
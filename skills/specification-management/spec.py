@@ -28,6 +28,13 @@ SKILLS_DIR = plugin_root / "skills"
 # Templates directory for fallback (deprecated)
 TEMPLATES_DIR = plugin_root / "templates"
 
+# Spec ID (e.g. "001") and spec directory name (e.g. "001-feature-name")
+SPEC_ID_PATTERN = re.compile(r'^\d{3}$')
+SPEC_DIR_PATTERN = re.compile(r'^(\d{3})-')
+
+# Runs of characters not allowed in directory names (see sanitize_name)
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
 
 def get_template_path(template_name: str) -> Path:
     """
@@ -61,7 +68,7 @@ def get_next_spec_id() -> str:
         for dir_path in SPECS_DIR.iterdir():
             if dir_path.is_dir():
                 # Extract number from pattern: 001-feature-name
-                match = re.match(r'^(\d{3})-', dir_path.name)
+                match = SPEC_DIR_PATTERN.match(dir_path.name)
                 if match:
                     num = int(match.group(1))
                     if num > max_id:
@@ -76,7 +83,7 @@ def sanitize_name(name: str) -> str:
     # Convert to lowercase
     name = name.lower()
     # Replace special characters with hyphens
-    name = re.sub(r'[^a-z0-9]+', '-', name)
+    name = NON_ALNUM_PATTERN.sub('-', name)
     # Remove leading/trailing hyphens
     name = name.strip('-')
     return name
@@ -145,7 +152,7 @@ def read_spec(spec_id: str) -> None:
 def create_spec(feature_name: str, template: Optional[str] = None) -> None:
     """Create a new spec directory with optional template."""
     # Check if feature_name is an existing spec ID (3 digits)
-    is_spec_id = re.match(r'^\d{3}$', feature_name)
+    is_spec_id = SPEC_ID_PATTERN.match(feature_name)
 
     if is_spec_id and template:
         # Try to find existing directory with this ID